@@ -0,0 +1,41 @@
+"""convert order status to enum
+
+Revision ID: 36ec68780d5b
+Revises: 23765bdd3b4a
+Create Date: 2026-10-15 13:02:55.104816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '36ec68780d5b'
+down_revision: Union[str, Sequence[str], None] = '23765bdd3b4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+order_status = sa.Enum('CREATED', 'PLACED', 'CANCELLED', name='order_status')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    order_status.create(op.get_bind())
+    op.alter_column('orders', 'status',
+               existing_type=sa.String(length=50),
+               type_=order_status,
+               existing_nullable=False,
+               postgresql_using='status::order_status')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('orders', 'status',
+               existing_type=order_status,
+               type_=sa.String(length=50),
+               existing_nullable=False,
+               postgresql_using='status::text')
+    order_status.drop(op.get_bind())
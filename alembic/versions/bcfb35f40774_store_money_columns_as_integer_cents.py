@@ -0,0 +1,45 @@
+"""store money columns as integer cents
+
+Revision ID: bcfb35f40774
+Revises: 0d42fab457a0
+Create Date: 2026-10-15 10:12:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bcfb35f40774'
+down_revision: Union[str, Sequence[str], None] = '0d42fab457a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MONEY_COLUMNS = [
+    ('menu_items', 'price'),
+    ('order_items', 'price'),
+    ('orders', 'total_amount'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.Numeric(precision=10, scale=2),
+                   type_=sa.BigInteger(),
+                   existing_nullable=False,
+                   postgresql_using=f'round({column} * 100)::bigint')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.BigInteger(),
+                   type_=sa.Numeric(precision=10, scale=2),
+                   existing_nullable=False,
+                   postgresql_using=f'{column} / 100.0')
@@ -0,0 +1,42 @@
+"""add denormalized order names
+
+Revision ID: c612bc23b29f
+Revises: 36ec68780d5b
+Create Date: 2026-10-15 13:48:21.390417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c612bc23b29f'
+down_revision: Union[str, Sequence[str], None] = '36ec68780d5b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('restaurant_name', sa.String(length=150), nullable=True))
+    op.add_column('order_items', sa.Column('menu_item_name', sa.String(length=150), nullable=True))
+
+    op.execute(
+        'UPDATE orders SET restaurant_name = restaurants.name '
+        'FROM restaurants WHERE restaurants.id = orders.restaurant_id'
+    )
+    op.execute(
+        'UPDATE order_items SET menu_item_name = menu_items.name '
+        'FROM menu_items WHERE menu_items.id = order_items.menu_item_id'
+    )
+
+    op.alter_column('orders', 'restaurant_name', nullable=False)
+    op.alter_column('order_items', 'menu_item_name', nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('order_items', 'menu_item_name')
+    op.drop_column('orders', 'restaurant_name')
@@ -0,0 +1,45 @@
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.core.config import settings
+
+
+# Shared response cache. When REDIS_URL is not configured every lookup is a miss.
+# Redis errors are treated as misses too, so an unavailable cache never fails a request.
+PREFIX = "slooze"
+
+redis = Redis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+
+
+async def get_cached(key: str) -> bytes | None:
+    if redis is None:
+        return None
+    try:
+        return await redis.get(f"{PREFIX}:{key}")
+    except RedisError:
+        return None
+
+
+async def set_cached(key: str, value: bytes, expire: int) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.set(f"{PREFIX}:{key}", value, ex=expire)
+    except RedisError:
+        pass
+
+
+async def invalidate(namespace: str) -> None:
+    """Drop every cached entry whose key starts with ``namespace:``."""
+    if redis is None:
+        return
+    try:
+        keys = [key async for key in redis.scan_iter(match=f"{PREFIX}:{namespace}:*")]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError:
+        pass
+
+
+async def close() -> None:
+    if redis is not None:
+        await redis.aclose()
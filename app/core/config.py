@@ -3,9 +3,17 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 50
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_USE_PGBOUNCER: bool = False  # DATABASE_URL points at PgBouncer in transaction mode
+    REDIS_URL: str | None = None  # response cache; disabled when unset
     SECRET_KEY: str = "supersecretkey"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # PEM key pair, only used with asymmetric algorithms such as EdDSA
+    JWT_PRIVATE_KEY: str | None = None
+    JWT_PUBLIC_KEY: str | None = None
 
     class Config:
         env_file = ".env"
@@ -1,18 +1,47 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from app.core.config import settings
+from app.core.security import JWT_VERIFYING_KEY
 from app.db.session import AsyncSessionLocal
 from app.models import User
+import hashlib
+import time
 import uuid
 
 
 # JWT Bearer only - no OAuth2 password flow. Use POST /auth/login to get a token, then paste it here.
 bearer_scheme = HTTPBearer()
 
+# Validated tokens -> (user, token expiry). Lets repeat requests with the same token skip
+# both the signature check and the user lookup. Expired entries are evicted lazily on insert.
+_JWT_CACHE: dict[bytes, tuple[User, float]] = {}
+_JWT_CACHE_MAXSIZE = 10_000
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(
+        token.encode(), key=settings.SECRET_KEY.encode()[:64], digest_size=16
+    ).digest()
+
+
+def _cache_user(key: bytes, user: User, exp: float) -> None:
+    if len(_JWT_CACHE) >= _JWT_CACHE_MAXSIZE:
+        # Tokens share one lifetime, so expiry roughly follows insertion order: drop
+        # expired entries from the front, then the oldest one if still full
+        now = time.time()
+        while _JWT_CACHE:
+            oldest = next(iter(_JWT_CACHE))
+            if _JWT_CACHE[oldest][1] > now:
+                break
+            del _JWT_CACHE[oldest]
+        if len(_JWT_CACHE) >= _JWT_CACHE_MAXSIZE:
+            del _JWT_CACHE[next(iter(_JWT_CACHE))]
+    _JWT_CACHE[key] = (user, exp)
+
 
 async def get_db():
     async with AsyncSessionLocal() as session:
@@ -20,10 +49,22 @@ async def get_db():
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_db),
 ):
+    # Resolved once per request, however many dependencies ask for it
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     token = credentials.credentials
+    key = _token_key(token)
+    cached = _JWT_CACHE.get(key)
+    if cached is not None and cached[1] > time.time():
+        request.state.user = cached[0]
+        return cached[0]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -31,24 +72,38 @@ async def get_current_user(
 
     try:
         payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            token, JWT_VERIFYING_KEY, algorithms=[settings.ALGORITHM]
         )
         user_id: str = payload.get("sub")
+        role_name: str | None = payload.get("role")
 
         if user_id is None:
             raise credentials_exception
 
         user_id = uuid.UUID(user_id)
 
-    except (JWTError, ValueError):
+    except (jwt.PyJWTError, ValueError):
         raise credentials_exception
 
-    result = await db.execute(
-        select(User).where(User.id == user_id).options(selectinload(User.role))
-    )
+    stmt = select(User).where(User.id == user_id)
+    if role_name is None:
+        # Tokens issued before every token carried the role claim
+        stmt = stmt.options(selectinload(User.role))
+
+    result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
     if user is None:
         raise credentials_exception
 
+    # The role comes from the token, so the role relationship is not loaded
+    user.role_name = role_name if role_name is not None else user.role.name
+
+    exp = payload.get("exp")
+    if exp is not None:
+        # Detach so the cached instance is not tied to this request's session
+        db.expunge(user)
+        _cache_user(key, user, exp)
+
+    request.state.user = user
     return user
@@ -0,0 +1,26 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Role, Country
+
+
+# Roles and countries are bootstrap data (see app/seed.py) that never change at runtime,
+# so their name -> id maps are loaded once per process on first use.
+ROLES: dict[str, int] = {}
+COUNTRIES: dict[str, int] = {}
+
+
+async def load(db: AsyncSession) -> None:
+    """Populate ``ROLES`` and ``COUNTRIES`` if they have not been loaded yet."""
+    if ROLES and COUNTRIES:
+        return
+
+    roles = await db.execute(select(Role.name, Role.id))
+    countries = await db.execute(select(Country.name, Country.id))
+    ROLES.update(roles.tuples().all())
+    COUNTRIES.update(countries.tuples().all())
+
+
+def refresh() -> None:
+    """Drop the cached maps so the next ``load`` re-reads them from the database."""
+    ROLES.clear()
+    COUNTRIES.clear()
@@ -0,0 +1,10 @@
+# Money is stored as integer cents (BigInteger columns) and exposed as decimal
+# amounts in the API, so conversions happen only at the request/response boundary.
+
+
+def to_cents(amount: float) -> int:
+    return round(amount * 100)
+
+
+def from_cents(cents: int) -> float:
+    return cents / 100
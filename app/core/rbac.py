@@ -2,12 +2,28 @@ from fastapi import Depends, HTTPException, status
 from app.core.dependencies import get_current_user
 
 
-def require_roles(*allowed_roles: str):
+# One bit per role, so role checks are integer tests instead of string compares
+ROLE_BITS = {"ADMIN": 1, "MANAGER": 2, "MEMBER": 4}
+ADMIN_BIT = ROLE_BITS["ADMIN"]
+
+
+def require_roles(*roles: str):
+    allowed_mask = 0
+    for role in roles:
+        allowed_mask |= ROLE_BITS[role]
+
     async def role_checker(current_user=Depends(get_current_user)):
-        if current_user.role.name not in allowed_roles:
+        role_bit = ROLE_BITS.get(current_user.role_name, 0)
+        if not role_bit & allowed_mask:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Access denied"
             )
+        current_user.role_bit = role_bit
         return current_user
 
     return role_checker
+
+
+REQUIRE_ALL_ROLES = require_roles("ADMIN", "MANAGER", "MEMBER")
+REQUIRE_ADMIN_MANAGER = require_roles("ADMIN", "MANAGER")
+REQUIRE_ADMIN = require_roles("ADMIN")
@@ -1,21 +1,160 @@
+import asyncio
 import hashlib
+import hmac
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from jose import jwt
 import bcrypt
+import jwt
 from app.core.config import settings
 
 
+class ValidCredCache:
+    """Small in-process TTL/LRU cache of recently verified credentials.
+
+    Keys are HMAC digests, so neither plaintext passwords nor their hashes are kept in memory.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> bool:
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False
+            self._entries.move_to_end(key)
+            return True
+
+    def add(self, key: bytes) -> None:
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def _jwt_keys():
+    """Return the (signing, verifying) keys for the configured JWT algorithm.
+
+    HMAC algorithms use ``SECRET_KEY`` for both; PyJWT verifies them with the stdlib
+    ``hmac`` module, i.e. OpenSSL. Asymmetric algorithms (e.g. EdDSA) need
+    ``cryptography`` and the PEM key pair, which is parsed once here rather than per token.
+    """
+    if settings.ALGORITHM.startswith("HS"):
+        return settings.SECRET_KEY, settings.SECRET_KEY
+
+    algorithm = jwt.get_algorithm_by_name(settings.ALGORITHM)
+    return (
+        algorithm.prepare_key(settings.JWT_PRIVATE_KEY),
+        algorithm.prepare_key(settings.JWT_PUBLIC_KEY),
+    )
+
+
+JWT_SIGNING_KEY, JWT_VERIFYING_KEY = _jwt_keys()
+
+_valid_creds = ValidCredCache(ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+# bcrypt is CPU-bound; running it in worker processes keeps it off the event loop
+# and out of the (small) default threadpool, and scales with the number of cores.
+# Workers are spawned fresh rather than forked from a process that is already running
+# its event loop. The pool is created on first use, so a new one replaces it after
+# shutdown (e.g. a second lifespan in the same process).
+_bcrypt_pool: ProcessPoolExecutor | None = None
+
+
+def _get_bcrypt_pool() -> ProcessPoolExecutor:
+    global _bcrypt_pool
+    if _bcrypt_pool is None:
+        _bcrypt_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _bcrypt_pool
+
+
+async def shutdown_bcrypt_pool() -> None:
+    """Stop the bcrypt worker processes; called on application shutdown."""
+    global _bcrypt_pool
+    pool, _bcrypt_pool = _bcrypt_pool, None
+    if pool is not None:
+        # Waiting for the workers to exit blocks, so keep it off the event loop
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+
+# Prefix marking hashes produced from the HMAC-SHA256 prehash. Hashes without it
+# were produced from the legacy hex SHA256 prehash and are upgraded on next login.
+_HMAC_PREFIX = "hmac-sha256:"
+
+
 def _prehash(password: str) -> bytes:
-    """Pre-hash with SHA256 to support passwords of any length (bcrypt has 72-byte limit)."""
+    """Pre-hash with HMAC-SHA256 to support passwords of any length (bcrypt has 72-byte limit)."""
+    return hmac.new(settings.SECRET_KEY.encode(), password.encode("utf-8"), "sha256").digest()
+
+
+def _legacy_prehash(password: str) -> bytes:
+    """Hex SHA256 prehash used by hashes created before the HMAC prehash."""
     return hashlib.sha256(password.encode()).hexdigest().encode()
 
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(_prehash(password), bcrypt.gensalt()).decode()
+def _cred_key(prehashed: bytes, hashed: str) -> bytes:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), prehashed + hashed.encode(), "sha256"
+    ).digest()
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt over its HMAC-SHA256 prehash.
+
+    The result is stored with the ``hmac-sha256:`` prefix. Older hashes (no prefix)
+    still verify via the legacy hex prehash; ``needs_rehash`` reports them so the
+    caller can replace them with this format after a successful login. Because the
+    prehash is keyed, rotating ``SECRET_KEY`` invalidates all stored passwords.
+    """
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(
+        _get_bcrypt_pool(), bcrypt.hashpw, _prehash(password), bcrypt.gensalt()
+    )
+    return _HMAC_PREFIX + hashed.decode()
+
+
+def needs_rehash(hashed: str) -> bool:
+    return not hashed.startswith(_HMAC_PREFIX)
+
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    """Check a password against its bcrypt hash.
+
+    Successful verifications are remembered for the token lifetime, so repeat
+    logins skip the bcrypt work factor. Failures are never cached.
+    """
+    prehashed = _prehash(plain)
+    key = _cred_key(prehashed, hashed)
+    if _valid_creds.get(key):
+        return True
+
+    if needs_rehash(hashed):
+        candidate, bcrypt_hash = _legacy_prehash(plain), hashed
+    else:
+        candidate, bcrypt_hash = prehashed, hashed[len(_HMAC_PREFIX):]
 
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(
+        _get_bcrypt_pool(), bcrypt.checkpw, candidate, bcrypt_hash.encode()
+    ):
+        return False
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return bcrypt.checkpw(_prehash(plain), hashed.encode())
+    _valid_creds.add(key)
+    return True
 
 
 def create_access_token(data: dict):
@@ -24,4 +163,4 @@ def create_access_token(data: dict):
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(to_encode, JWT_SIGNING_KEY, algorithm=settings.ALGORITHM)
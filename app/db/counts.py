@@ -0,0 +1,36 @@
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Below this many rows an exact COUNT is cheap enough, and the planner's estimate
+# (stale until the next ANALYZE, -1 if the table was never analyzed) is not worth it.
+APPROX_COUNT_MIN = 10_000
+
+# The estimate only changes on ANALYZE, so it is re-read at most this often per process
+APPROX_COUNT_TTL_SECONDS = 300
+
+# table -> (estimate or None, monotonic expiry)
+_ESTIMATES: dict[str, tuple[int | None, float]] = {}
+
+
+async def approx_count(db: AsyncSession, table: str) -> int | None:
+    """Return the planner's row estimate for an unfiltered ``table``.
+
+    Returns ``None`` when the table is small (or never analyzed), in which case callers
+    should count exactly. The result is cached per process, so most calls cost no query.
+    """
+    cached = _ESTIMATES.get(table)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    # to_regclass resolves the name through search_path, like the queries on the table
+    estimate = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table},
+    )
+    if estimate is not None and estimate < APPROX_COUNT_MIN:
+        estimate = None
+
+    _ESTIMATES[table] = (estimate, time.monotonic() + APPROX_COUNT_TTL_SECONDS)
+    return estimate
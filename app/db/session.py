@@ -1,9 +1,28 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer (transaction mode) does the pooling: every checkout opens a short-lived
+    # connection to it, and prepared statement caches must be off since consecutive
+    # statements may land on different server connections.
+    engine_options = {
+        "poolclass": NullPool,
+        "connect_args": {"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+    }
+else:
+    # Sized for auth bursts, where requests hold a connection while bcrypt runs.
+    # No pre-ping: stale connections are recycled on a timer instead of probed per checkout.
+    engine_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": False,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+engine = create_async_engine(settings.DATABASE_URL, echo=True, **engine_options)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
     expire_on_commit=False
-)
\ No newline at end of file
+)
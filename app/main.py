@@ -1,5 +1,11 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core import cache
+from app.core.security import shutdown_bcrypt_pool
 from app.routers import auth
 from app.routers import restaurants
 from app.routers import menu_items
@@ -12,8 +18,31 @@ allow_origins = [
 ]
 
 
-app = FastAPI()
+def _check_pure_asgi(app: FastAPI) -> None:
+    """Keep the middleware stack pure ASGI: BaseHTTPMiddleware (and @app.middleware("http"))
+    adds a task and memory streams around every request."""
+    for middleware in app.user_middleware:
+        if isinstance(middleware.cls, type) and issubclass(middleware.cls, BaseHTTPMiddleware):
+            raise RuntimeError(
+                f"{middleware.cls.__name__} is based on BaseHTTPMiddleware; write it as a pure ASGI middleware instead"
+            )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Checked at startup rather than import, so middleware registered anywhere
+    # before the server starts is covered too
+    _check_pure_asgi(app)
+    yield
+    await cache.close()
+    await shutdown_bcrypt_pool()
+
+
+# orjson renders response bodies in C instead of the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
+# CORSMiddleware is pure ASGI and answers preflight (OPTIONS) requests itself,
+# so they never reach routing or the endpoint dependencies.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
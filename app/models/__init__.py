@@ -3,6 +3,6 @@ from .country import Country
 from .user import User
 from .restaurant import Restaurant
 from .menu_item import MenuItem
-from .order import Order
+from .order import Order, OrderStatus
 from .order_item import OrderItem
 from .payment_method import PaymentMethod
@@ -1,15 +1,19 @@
-from sqlalchemy import String, ForeignKey, Numeric, Boolean, Text
+from sqlalchemy import String, ForeignKey, BigInteger, Boolean, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
 
 class MenuItem(Base):
     __tablename__ = "menu_items"
+    __table_args__ = (
+        # Serves the per-restaurant listing ordered by id
+        Index("ix_menu_items_restaurant_id_id", "restaurant_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(150))
     description: Mapped[str] = mapped_column(Text, nullable=True)
-    price: Mapped[float] = mapped_column(Numeric(10, 2))
+    price: Mapped[int] = mapped_column(BigInteger)  # cents
     is_available: Mapped[bool] = mapped_column(Boolean, default=True)
 
     restaurant_id: Mapped[int] = mapped_column(
@@ -1,12 +1,25 @@
+import enum
 import uuid
-from sqlalchemy import ForeignKey, String, Numeric
+from sqlalchemy import ForeignKey, String, BigInteger, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.base import Base
 
 
+class OrderStatus(str, enum.Enum):
+    CREATED = "CREATED"
+    PLACED = "PLACED"
+    CANCELLED = "CANCELLED"
+
+
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Serves the per-restaurant order listing ordered by id
+        Index("ix_orders_restaurant_id_id", "restaurant_id", "id"),
+        # Serves the ON DELETE CASCADE from users
+        Index("ix_orders_user_id", "user_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -17,9 +30,13 @@ class Order(Base):
     )
 
     restaurant_id: Mapped[int] = mapped_column(ForeignKey("restaurants.id"))
+    # Copied from the restaurant when the order is created, so listings need no join
+    restaurant_name: Mapped[str] = mapped_column(String(150))
 
-    status: Mapped[str] = mapped_column(String(50), default="CREATED")
-    total_amount: Mapped[float] = mapped_column(Numeric(10, 2), default=0)
+    status: Mapped[OrderStatus] = mapped_column(
+        Enum(OrderStatus, name="order_status"), default=OrderStatus.CREATED
+    )
+    total_amount: Mapped[int] = mapped_column(BigInteger, default=0)  # cents
 
     user = relationship("User")
     restaurant = relationship("Restaurant")
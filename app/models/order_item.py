@@ -1,19 +1,25 @@
-from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy import String, ForeignKey, Integer, BigInteger, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        # Serves the join from orders in the order listing, in item order
+        Index("ix_order_items_order_id_id", "order_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
     order_id: Mapped[str] = mapped_column(ForeignKey("orders.id", ondelete="CASCADE"))
 
     menu_item_id: Mapped[int] = mapped_column(ForeignKey("menu_items.id"))
+    # Copied from the menu item when it is added, so listings need no join
+    menu_item_name: Mapped[str] = mapped_column(String(150))
 
     quantity: Mapped[int] = mapped_column(Integer)
-    price: Mapped[float] = mapped_column(Numeric(10, 2))
+    price: Mapped[int] = mapped_column(BigInteger)  # cents
 
     order = relationship("Order", back_populates="items")
     menu_item = relationship("MenuItem")
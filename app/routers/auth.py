@@ -3,8 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from app.db.session import AsyncSessionLocal
-from app.models import User, Role, Country
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core import lookups
+from app.models import User
+from app.core.security import (
+    hash_password,
+    verify_password,
+    needs_rehash,
+    create_access_token,
+)
 from app.schemas.auth import RegisterRequest, RegisterResponse, LoginRequest, LoginResponse
 from app.schemas.errors import (
     build_responses,
@@ -37,28 +43,29 @@ async def register(data: RegisterRequest, db: AsyncSession = Depends(get_db)):
     - **422** – Request body failed validation.
     - **500** – Unexpected server error.
     """
-    role = await db.scalar(select(Role).where(Role.name == data.role.value))
-    country = await db.scalar(select(Country).where(Country.name == data.country.value))
+    await lookups.load(db)
+    role_id = lookups.ROLES.get(data.role.value)
+    country_id = lookups.COUNTRIES.get(data.country.value)
 
-    if not role or not country:
+    if role_id is None or country_id is None:
         raise HTTPException(status_code=400, detail="Invalid role or country")
 
     user = User(
         name=data.name,
         email=data.email,
-        password_hash=hash_password(data.password),
-        role_id=role.id,
-        country_id=country.id,
+        password_hash=await hash_password(data.password),
+        role_id=role_id,
+        country_id=country_id,
     )
 
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     token = create_access_token({
         "sub": str(user.id),
         "name": user.name,
         "email": user.email,
+        "role": data.role.value,
     })
     return RegisterResponse(
         id=str(user.id),
@@ -87,9 +94,14 @@ async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
         select(User).where(User.email == data.email).options(selectinload(User.role))
     )
 
-    if not user or not verify_password(data.password, user.password_hash):
+    if not user or not await verify_password(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    # Upgrade hashes created with the legacy prehash now that we know the password
+    if needs_rehash(user.password_hash):
+        user.password_hash = await hash_password(data.password)
+        await db.commit()
+
     token = create_access_token({
         "sub": str(user.id),
         "name": user.name,
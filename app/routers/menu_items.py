@@ -1,8 +1,13 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 from app.core.dependencies import get_db
-from app.core.rbac import require_roles
+from app.core.money import to_cents, from_cents
+from app.core.rbac import ADMIN_BIT, REQUIRE_ADMIN, REQUIRE_ALL_ROLES
 from app.models import MenuItem, Restaurant
 from app.schemas.menu_item import (
     MenuItemCreate,
@@ -19,11 +24,13 @@ from app.schemas.errors import (
 
 router = APIRouter(prefix="/menu-items", tags=["Menu Items"])
 
+FOREIGN_KEY_VIOLATION = "23503"
+
 
 @router.post(
     "/",
     response_model=MenuItemCreatedResponse,
-    dependencies=[Depends(require_roles("ADMIN"))],
+    dependencies=[Depends(REQUIRE_ADMIN)],
     responses=AUTHENTICATED_NOT_FOUND_RESPONSES,
     summary="Create a new menu item",
 )
@@ -40,25 +47,22 @@ async def create_menu_item(
     - **422** – Request body failed validation.
     - **500** – Unexpected server error.
     """
-    # Validate restaurant exists
-    result = await db.execute(
-        select(Restaurant).where(Restaurant.id == data.restaurant_id)
-    )
-    restaurant = result.scalar_one_or_none()
-
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
     menu_item = MenuItem(
         name=data.name,
         description=data.description,
-        price=data.price,
+        price=to_cents(data.price),
         restaurant_id=data.restaurant_id,
     )
 
     db.add(menu_item)
-    await db.commit()
-    await db.refresh(menu_item)
+    # Let the restaurant FK reject unknown restaurants instead of checking up front
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION:
+            raise HTTPException(status_code=404, detail="Restaurant not found")
+        raise
 
     return MenuItemCreatedResponse(message="Menu item created successfully")
 
@@ -71,63 +75,85 @@ async def create_menu_item(
 )
 async def get_menu_items(
     restaurant_id: int,
-    current_user=Depends(require_roles("ADMIN", "MANAGER", "MEMBER")),
+    current_user=Depends(REQUIRE_ALL_ROLES),
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    after_id: Optional[int] = Query(
+        None, ge=0, description="Cursor: return items with an id greater than this (ignores skip)"
+    ),
 ):
     """
     Retrieve paginated menu items for a given restaurant.
     Non-admin users can only access restaurants in their own country.
 
+    Pass the returned ``next_cursor`` as ``after_id`` to fetch the next page; this is
+    preferred over ``skip``, whose cost grows with the page depth.
+
     **Possible errors:**
     - **401** – Missing or invalid authentication token.
-    - **403** – You do not have access to this restaurant's menu (country restriction).
-    - **404** – The specified restaurant does not exist.
+    - **403** – Insufficient permissions for this action.
+    - **404** – The specified restaurant does not exist (or is outside your country).
     - **422** – Query parameters failed validation.
     - **500** – Unexpected server error.
     """
-    # Fetch restaurant first
-    result = await db.execute(select(Restaurant).where(Restaurant.id == restaurant_id))
-    restaurant = result.scalar_one_or_none()
+    # Restaurant must exist and, for non-admins, be in the user's country
+    conds = [Restaurant.id == restaurant_id]
+    if current_user.role_bit != ADMIN_BIT:
+        conds.append(Restaurant.country_id == current_user.country_id)
 
-    if not restaurant:
+    if await db.scalar(select(Restaurant.id).where(*conds)) is None:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    # Country restriction
-    if current_user.role.name != "ADMIN":
-        if restaurant.country_id != current_user.country_id:
-            raise HTTPException(status_code=403, detail="Access denied")
+    # Fetch paginated items along with the total count in a single query
+    total_col = func.count().over()
+    conds = [MenuItem.restaurant_id == restaurant_id]
+
+    if after_id is not None:
+        # Keyset pagination: seek past the cursor instead of reading and discarding
+        # skipped rows. The window count would only see rows after the cursor, so
+        # count the whole menu with an (uncorrelated) subquery instead.
+        skip = 0
+        conds.append(MenuItem.id > after_id)
+        total_col = (
+            select(func.count(MenuItem.id))
+            .where(MenuItem.restaurant_id == restaurant_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
 
-    # Count total items
-    count_result = await db.execute(
-        select(func.count(MenuItem.id)).where(MenuItem.restaurant_id == restaurant_id)
-    )
-    total = count_result.scalar()
-
-    # Fetch paginated items
     query = (
-        select(MenuItem)
-        .where(MenuItem.restaurant_id == restaurant_id)
+        select(MenuItem, total_col.label("total"))
+        .options(raiseload("*"))
+        .where(*conds)
+        .order_by(MenuItem.id)
         .offset(skip)
         .limit(limit)
     )
-    result = await db.execute(query)
-    menu_items = result.scalars().all()
-
-    items = [MenuItemResponse.model_validate(m) for m in menu_items]
-    num_items = len(items)
-    start = skip + 1 if num_items > 0 else 0
-    end = skip + num_items
+    # Build the response while streaming rows instead of materializing them first.
+    # Rows come straight from the database, so skip validation.
+    total = 0
+    items = []
+    async for m, total in await db.stream(query):
+        items.append(
+            MenuItemResponse.model_construct(
+                id=m.id,
+                name=m.name,
+                description=m.description,
+                price=from_cents(m.price),
+                is_available=m.is_available,
+                restaurant_id=m.restaurant_id,
+            )
+        )
 
     return MenuItemListResponse(
         items=items,
+        next_cursor=items[-1].id if len(items) == limit else None,
         pagination_metadata=PaginationMetadata(
             total=total,
             skip=skip,
             limit=limit,
-            start=start,
-            end=end,
+            num_items=len(items),
         ),
     )
 
@@ -135,7 +161,7 @@ async def get_menu_items(
 @router.patch(
     "/{menu_item_id}/availability",
     response_model=MenuItemAvailabilityUpdatedResponse,
-    dependencies=[Depends(require_roles("ADMIN"))],
+    dependencies=[Depends(REQUIRE_ADMIN)],
     responses=AUTHENTICATED_NOT_FOUND_RESPONSES,
     summary="Toggle menu item availability",
 )
@@ -152,8 +178,7 @@ async def toggle_availability(
     - **422** – Path parameter failed validation.
     - **500** – Unexpected server error.
     """
-    result = await db.execute(select(MenuItem).where(MenuItem.id == menu_item_id))
-    item = result.scalar_one_or_none()
+    item = await db.get(MenuItem, menu_item_id)
 
     if not item:
         raise HTTPException(status_code=404, detail="Menu item not found")
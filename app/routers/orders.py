@@ -1,20 +1,20 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, func, exists, literal
 from uuid import UUID
 from app.core.dependencies import get_db
-from app.core.rbac import require_roles
-from app.models import Order, OrderItem, Restaurant, MenuItem, PaymentMethod
+from app.core.money import from_cents
+from app.core.rbac import ADMIN_BIT, REQUIRE_ADMIN_MANAGER, REQUIRE_ALL_ROLES
+from app.db.counts import approx_count
+from app.models import Order, OrderItem, OrderStatus, Restaurant, MenuItem, PaymentMethod
 from app.schemas.order import (
     GetOrdersQuery,
     OrderCreate,
     OrderCreateResponse,
-    OrderItemDetail,
     OrderListResponse,
-    OrderResponse,
     AddItemRequest,
     AddItemResponse,
     CheckoutRequest,
@@ -41,13 +41,12 @@ def get_orders_query(
 
 @router.get(
     "/",
-    response_model=OrderListResponse,
-    responses=AUTHENTICATED_FORBIDDEN_RESPONSES,
+    responses={200: {"model": OrderListResponse}, **AUTHENTICATED_FORBIDDEN_RESPONSES},
     summary="List all orders",
 )
 async def list_orders(
     query: GetOrdersQuery = Depends(get_orders_query),
-    current_user=Depends(require_roles("ADMIN", "MANAGER", "MEMBER")),
+    current_user=Depends(REQUIRE_ALL_ROLES),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -60,70 +59,89 @@ async def list_orders(
     - **422** – Query parameters failed validation.
     - **500** – Unexpected server error.
     """
-    base = (
-        select(Order)
-        .options(
-            selectinload(Order.restaurant),
-            selectinload(Order.items).selectinload(OrderItem.menu_item),
-        )
-    )
-    count_stmt = select(func.count(Order.id))
+    # The unfiltered admin listing of a large table uses the planner's row estimate
+    # instead of an exact O(rows) count
+    estimate = None
+    if current_user.role_bit == ADMIN_BIT and query.restaurant_id is None:
+        estimate = await approx_count(db, Order.__tablename__)
+    total_col = func.count().over() if estimate is None else literal(estimate)
+
+    # Page of order ids (with the total count) first, so LIMIT applies to orders
+    # rather than to the joined order/item rows below.
+    page = select(Order.id, total_col.label("total"))
 
     # Country-based restriction for non-admin users
-    if current_user.role.name != "ADMIN":
-        base = base.join(Restaurant, Order.restaurant_id == Restaurant.id).where(
-            Restaurant.country_id == current_user.country_id
-        )
-        count_stmt = count_stmt.join(Restaurant, Order.restaurant_id == Restaurant.id).where(
+    if current_user.role_bit != ADMIN_BIT:
+        page = page.join(Restaurant, Order.restaurant_id == Restaurant.id).where(
             Restaurant.country_id == current_user.country_id
         )
 
     if query.restaurant_id is not None:
-        base = base.where(Order.restaurant_id == query.restaurant_id)
-        count_stmt = count_stmt.where(Order.restaurant_id == query.restaurant_id)
-
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar() or 0
-
-    result = await db.execute(
-        base.order_by(Order.id).offset(query.skip).limit(query.limit)
-    )
-    orders = result.scalars().all()
-
-    items = [
-        OrderResponse(
-            id=o.id,
-            user_id=o.user_id,
-            restaurant_id=o.restaurant_id,
-            restaurant_name=o.restaurant.name,
-            status=o.status,
-            total_amount=float(o.total_amount),
-            items=[
-                OrderItemDetail(
-                    menu_item_name=item.menu_item.name,
-                    quantity=item.quantity,
-                    price=float(item.price),
-                )
-                for item in o.items
-            ],
+        page = page.where(Order.restaurant_id == query.restaurant_id)
+
+    page = page.order_by(Order.id).offset(query.skip).limit(query.limit).subquery()
+
+    # Plain Core rows (no ORM hydration), one per order item; orders without items
+    # still come back once thanks to the outer joins.
+    stmt = (
+        select(
+            Order.id,
+            Order.user_id,
+            Order.restaurant_id,
+            Order.restaurant_name,
+            Order.status,
+            Order.total_amount,
+            OrderItem.quantity,
+            OrderItem.price,
+            OrderItem.menu_item_name,
+            page.c.total,
         )
-        for o in orders
-    ]
-
-    num_items = len(items)
-    start = query.skip + 1 if num_items > 0 else 0
-    end = query.skip + num_items
-
-    return OrderListResponse(
-        items=items,
-        pagination_metadata=PaginationMetadata(
+        .join(page, page.c.id == Order.id)
+        .outerjoin(OrderItem, OrderItem.order_id == Order.id)
+        .order_by(Order.id, OrderItem.id)
+    )
+    # Server-side cursor fetched in chunks, so the joined rows are grouped as they
+    # arrive instead of all being buffered first.
+    result = await db.stream(stmt.execution_options(yield_per=200))
+
+    # Group rows by order. Emit plain JSON types directly (orjson handles UUIDs) instead
+    # of going through response_model validation and jsonable_encoder; response_model
+    # documents the shape.
+    orders: dict[UUID, dict] = {}
+    total = estimate or 0
+    async for (
+        order_id, user_id, restaurant_id, restaurant_name, status, total_amount,
+        quantity, price, menu_item_name, total,
+    ) in result:
+        order = orders.get(order_id)
+        if order is None:
+            order = orders[order_id] = {
+                "id": order_id,
+                "user_id": user_id,
+                "restaurant_id": restaurant_id,
+                "restaurant_name": restaurant_name,
+                "status": status,
+                "total_amount": from_cents(total_amount),
+                "items": [],
+            }
+        if quantity is not None:
+            order["items"].append({
+                "menu_item_name": menu_item_name,
+                "quantity": quantity,
+                "price": from_cents(price),
+            })
+
+    items = list(orders.values())
+
+    return ORJSONResponse({
+        "items": items,
+        "pagination_metadata": PaginationMetadata(
             total=total,
             skip=query.skip,
             limit=query.limit,
-            start=start,
-            end=end,
-        ),
-    )
+            num_items=len(items),
+        ).model_dump(),
+    })
 
 
 @router.post(
@@ -134,7 +152,7 @@ async def list_orders(
 )
 async def create_order(
     data: OrderCreate,
-    current_user=Depends(require_roles("ADMIN", "MANAGER", "MEMBER")),
+    current_user=Depends(REQUIRE_ALL_ROLES),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -143,25 +161,25 @@ async def create_order(
 
     **Possible errors:**
     - **401** – Missing or invalid authentication token.
-    - **403** – You do not have access to this restaurant (country restriction).
-    - **404** – The specified restaurant does not exist.
+    - **403** – Insufficient permissions for this action.
+    - **404** – The specified restaurant does not exist (or is outside your country).
     - **422** – Request body failed validation.
     - **500** – Unexpected server error.
     """
-    result = await db.execute(
-        select(Restaurant).where(Restaurant.id == data.restaurant_id)
-    )
-    restaurant = result.scalar_one_or_none()
+    # Restaurant must exist and, for non-admins, be in the user's country
+    conds = [Restaurant.id == data.restaurant_id]
+    if current_user.role_bit != ADMIN_BIT:
+        conds.append(Restaurant.country_id == current_user.country_id)
 
-    if not restaurant:
+    restaurant_name = await db.scalar(select(Restaurant.name).where(*conds))
+    if restaurant_name is None:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    # Country restriction
-    if current_user.role.name != "ADMIN":
-        if restaurant.country_id != current_user.country_id:
-            raise HTTPException(status_code=403, detail="Access denied")
-
-    order = Order(user_id=current_user.id, restaurant_id=data.restaurant_id)
+    order = Order(
+        user_id=current_user.id,
+        restaurant_id=data.restaurant_id,
+        restaurant_name=restaurant_name,
+    )
 
     db.add(order)
     await db.commit()
@@ -179,7 +197,7 @@ async def create_order(
 async def add_item(
     order_id: UUID,
     data: AddItemRequest,
-    current_user=Depends(require_roles("ADMIN", "MANAGER", "MEMBER")),
+    current_user=Depends(REQUIRE_ALL_ROLES),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -194,37 +212,65 @@ async def add_item(
     - **422** – Request body failed validation.
     - **500** – Unexpected server error.
     """
-    result = await db.execute(select(Order).where(Order.id == order_id))
-    order = result.scalar_one_or_none()
-
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
+    # One statement: lock the order if it is still open and the caller may edit it,
+    # copy the available menu item into order_items and add the new line to the
+    # total. A concurrent checkout either waits on the row lock or has already
+    # moved the order out of CREATED, in which case nothing is inserted.
+    order_conds = [Order.id == order_id, Order.status == OrderStatus.CREATED]
+    if current_user.role_bit != ADMIN_BIT:
+        order_conds.append(Order.user_id == current_user.id)
+    locked = select(Order.id).where(*order_conds).with_for_update().cte("o")
+
+    inserted = (
+        insert(OrderItem)
+        .from_select(
+            ["order_id", "menu_item_id", "menu_item_name", "quantity", "price"],
+            select(
+                locked.c.id,
+                MenuItem.id,
+                MenuItem.name,
+                literal(data.quantity),
+                MenuItem.price,
+            )
+            .select_from(locked)
+            .join(
+                MenuItem,
+                (MenuItem.id == data.menu_item_id) & MenuItem.is_available.is_(True),
+            ),
+        )
+        .returning(
+            OrderItem.order_id,
+            (OrderItem.price * OrderItem.quantity).label("delta"),
+        )
+        .cte("ins")
+    )
 
-    # Ownership check
-    if current_user.role.name != "ADMIN":
-        if order.user_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not your order")
+    result = await db.execute(
+        update(Order)
+        .where(Order.id == inserted.c.order_id)
+        .values(total_amount=Order.total_amount + inserted.c.delta)
+        .returning(Order.id)
+        .execution_options(synchronize_session=False)
+    )
 
-    if order.status != "CREATED":
-        raise HTTPException(status_code=400, detail="Order already finalized")
+    if result.one_or_none() is None:
+        await db.rollback()
 
-    # Fetch menu item
-    result = await db.execute(select(MenuItem).where(MenuItem.id == data.menu_item_id))
-    menu_item = result.scalar_one_or_none()
+        # Nothing was added; find out why
+        order = await db.get(Order, order_id)
+        if not order:
+            raise HTTPException(status_code=404, detail="Order not found")
 
-    if not menu_item or not menu_item.is_available:
-        raise HTTPException(status_code=404, detail="Menu item unavailable")
+        # Ownership check
+        if current_user.role_bit != ADMIN_BIT:
+            if order.user_id != current_user.id:
+                raise HTTPException(status_code=403, detail="Not your order")
 
-    order_item = OrderItem(
-        order_id=order.id,
-        menu_item_id=menu_item.id,
-        quantity=data.quantity,
-        price=menu_item.price,
-    )
+        if order.status != OrderStatus.CREATED:
+            raise HTTPException(status_code=400, detail="Order already finalized")
 
-    order.total_amount += menu_item.price * data.quantity
+        raise HTTPException(status_code=404, detail="Menu item unavailable")
 
-    db.add(order_item)
     await db.commit()
 
     return AddItemResponse(message="Item added successfully")
@@ -239,7 +285,7 @@ async def add_item(
 async def checkout_order(
     order_id: UUID,
     data: CheckoutRequest,
-    current_user=Depends(require_roles("ADMIN", "MANAGER")),
+    current_user=Depends(REQUIRE_ADMIN_MANAGER),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -254,38 +300,45 @@ async def checkout_order(
     - **422** – Request body failed validation.
     - **500** – Unexpected server error.
     """
-    result = await db.execute(select(Order).where(Order.id == order_id))
-    order = result.scalar_one_or_none()
-
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
+    # Check and transition in one atomic statement; only diagnose on failure
+    conds = [
+        Order.id == order_id,
+        Order.status == OrderStatus.CREATED,
+        exists().where(PaymentMethod.id == data.payment_id),
+    ]
     # Ownership check: non-admin users can only checkout their own orders
-    if current_user.role.name != "ADMIN":
-        if order.user_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Access denied: not your order")
-
-    if order.status != "CREATED":
-        raise HTTPException(status_code=400, detail="Already processed")
+    if current_user.role_bit != ADMIN_BIT:
+        conds.append(Order.user_id == current_user.id)
 
-    # Validate payment method exists
     result = await db.execute(
-        select(PaymentMethod)
-        .where(PaymentMethod.id == data.payment_id)
+        update(Order)
+        .where(*conds)
+        .values(status=OrderStatus.PLACED)
+        .returning(Order.id, Order.status, Order.total_amount)
     )
-    payment = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not payment:
-        raise HTTPException(status_code=404, detail="Payment method not found")
+    if row is None:
+        order = await db.get(Order, order_id)
+
+        if not order:
+            raise HTTPException(status_code=404, detail="Order not found")
+
+        if current_user.role_bit != ADMIN_BIT:
+            if order.user_id != current_user.id:
+                raise HTTPException(status_code=403, detail="Access denied: not your order")
 
-    order.status = "PLACED"
+        if order.status != OrderStatus.CREATED:
+            raise HTTPException(status_code=400, detail="Already processed")
+
+        raise HTTPException(status_code=404, detail="Payment method not found")
 
     await db.commit()
 
     return CheckoutResponse(
-        order_id=order.id,
-        status=order.status,
-        total_amount=float(order.total_amount),
+        order_id=row.id,
+        status=row.status,
+        total_amount=from_cents(row.total_amount),
     )
 
 
@@ -297,7 +350,7 @@ async def checkout_order(
 )
 async def cancel_order(
     order_id: UUID,
-    current_user=Depends(require_roles("ADMIN", "MANAGER")),
+    current_user=Depends(REQUIRE_ADMIN_MANAGER),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -312,19 +365,21 @@ async def cancel_order(
     - **422** – Path parameter failed validation.
     - **500** – Unexpected server error.
     """
-    result = await db.execute(select(Order).where(Order.id == order_id))
-    order = result.scalar_one_or_none()
+    result = await db.execute(
+        update(Order)
+        .where(Order.id == order_id, Order.status == OrderStatus.PLACED)
+        .values(status=OrderStatus.CANCELLED)
+        .returning(Order.id)
+    )
 
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
+    if result.one_or_none() is None:
+        if not await db.get(Order, order_id):
+            raise HTTPException(status_code=404, detail="Order not found")
 
-    if order.status != "PLACED":
         raise HTTPException(
             status_code=400, detail="Only placed orders can be cancelled"
         )
 
-    order.status = "CANCELLED"
-
     await db.commit()
 
     return CancelOrderResponse(message="Order cancelled")
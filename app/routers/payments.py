@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, literal
+from sqlalchemy.orm import raiseload
 from app.core.dependencies import get_db
-from app.core.rbac import require_roles
+from app.core.rbac import REQUIRE_ADMIN, REQUIRE_ALL_ROLES
+from app.db.counts import approx_count
 from app.models import PaymentMethod
 from app.schemas.payment import (
     PaymentMethodCreate,
     PaymentMethodUpdate,
-    PaymentMethodResponse,
     PaymentMethodCreatedResponse,
     PaymentMethodListResponse,
     PaymentMethodUpdatedResponse,
@@ -21,6 +23,17 @@ from app.schemas.errors import (
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
 
+def _pm_from_orm(p: PaymentMethod) -> dict:
+    """Shape a trusted ORM row like ``PaymentMethodResponse`` without validating it."""
+    return {
+        "id": p.id,
+        "type": p.type,
+        "provider": p.provider,
+        "last_four": p.last_four,
+        "is_default": p.is_default,
+    }
+
+
 @router.post(
     "/",
     response_model=PaymentMethodCreatedResponse,
@@ -29,7 +42,7 @@ router = APIRouter(prefix="/payments", tags=["Payments"])
 )
 async def add_payment_method(
     data: PaymentMethodCreate,
-    current_user=Depends(require_roles("ADMIN")),
+    current_user=Depends(REQUIRE_ADMIN),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -66,12 +79,11 @@ async def add_payment_method(
 
 @router.get(
     "/",
-    response_model=PaymentMethodListResponse,
-    responses=AUTHENTICATED_FORBIDDEN_RESPONSES,
+    responses={200: {"model": PaymentMethodListResponse}, **AUTHENTICATED_FORBIDDEN_RESPONSES},
     summary="List payment methods",
 )
 async def get_payments(
-    current_user=Depends(require_roles("ADMIN", "MANAGER", "MEMBER")),
+    current_user=Depends(REQUIRE_ALL_ROLES),
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -85,31 +97,35 @@ async def get_payments(
     - **422** – Query parameters failed validation.
     - **500** – Unexpected server error.
     """
-    count_result = await db.execute(
-        select(func.count(PaymentMethod.id))
-    )
-    total = count_result.scalar()
+    # Page and total count in a single query; large tables use the planner's
+    # row estimate instead of an exact O(rows) count
+    estimate = await approx_count(db, PaymentMethod.__tablename__)
+    total_col = func.count().over() if estimate is None else literal(estimate)
 
     result = await db.execute(
-        select(PaymentMethod).offset(skip).limit(limit)
+        select(PaymentMethod, total_col.label("total"))
+        .options(raiseload("*"))
+        .order_by(PaymentMethod.id)
+        .offset(skip)
+        .limit(limit)
     )
-    payment_methods = result.scalars().all()
+    rows = result.all()
 
-    items = [PaymentMethodResponse.model_validate(p) for p in payment_methods]
-    num_items = len(items)
-    start = skip + 1 if num_items > 0 else 0
-    end = skip + num_items
+    total = rows[0].total if rows else (estimate or 0)
+    payment_methods = [row.PaymentMethod for row in rows]
 
-    return PaymentMethodListResponse(
-        items=items,
-        pagination_metadata=PaginationMetadata(
+    # Emit plain JSON types directly, bypassing response_model validation and jsonable_encoder
+    items = [_pm_from_orm(p) for p in payment_methods]
+
+    return ORJSONResponse({
+        "items": items,
+        "pagination_metadata": PaginationMetadata(
             total=total,
             skip=skip,
             limit=limit,
-            start=start,
-            end=end,
-        ),
-    )
+            num_items=len(items),
+        ).model_dump(),
+    })
 
 
 @router.put(
@@ -121,7 +137,7 @@ async def get_payments(
 async def update_payment_method(
     payment_id: int,
     data: PaymentMethodUpdate,
-    current_user=Depends(require_roles("ADMIN")),
+    current_user=Depends(REQUIRE_ADMIN),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -134,10 +150,7 @@ async def update_payment_method(
     - **422** – Request body failed validation.
     - **500** – Unexpected server error.
     """
-    result = await db.execute(
-        select(PaymentMethod).where(PaymentMethod.id == payment_id)
-    )
-    payment = result.scalar_one_or_none()
+    payment = await db.get(PaymentMethod, payment_id)
 
     if not payment:
         raise HTTPException(status_code=404, detail="Payment method not found")
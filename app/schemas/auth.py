@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 
 
 class RoleEnum(str, Enum):
@@ -23,9 +23,21 @@ class RegisterRequest(BaseModel):
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    # Plain str: a login only needs the address to look up, the full EmailStr
+    # validation already ran when the account was registered.
+    email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        v = v.strip()
+        local, at, domain = v.rpartition("@")
+        if not at or not local or not domain or len(v) > 254:
+            raise ValueError("value is not a valid email address")
+        # Same normalization as EmailStr at registration: only the domain is lowercased
+        return f"{local}@{domain.lower()}"
+
 
 class RegisterResponse(BaseModel):
     id: str
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Mapping
+
 from pydantic import BaseModel
 
 
@@ -69,12 +72,24 @@ INTERNAL_SERVER_ERROR_500 = _error(
 # ── Convenience combinators ─────────────────────────────────────────────
 
 
-def build_responses(*dicts: dict) -> dict:
-    """Merge multiple single-key response dicts into one ``responses`` mapping."""
-    merged: dict = {}
-    for d in dicts:
-        merged.update(d)
-    return merged
+# Memoized combos keyed by the identity of their inputs. The inputs are kept alive
+# alongside the result so their ids cannot be reused by other objects.
+_COMBO_CACHE: dict[tuple[int, ...], tuple[tuple[dict, ...], Mapping]] = {}
+
+
+def build_responses(*dicts: dict) -> Mapping:
+    """Merge multiple single-key response dicts into one read-only ``responses`` mapping.
+
+    Each combination is built once and the same frozen mapping is shared by every route using it.
+    """
+    key = tuple(map(id, dicts))
+    cached = _COMBO_CACHE.get(key)
+    if cached is None:
+        merged: dict = {}
+        for d in dicts:
+            merged.update(d)
+        cached = _COMBO_CACHE[key] = (dicts, MappingProxyType(merged))
+    return cached[1]
 
 
 # Pre-built combos used across many routes
@@ -32,6 +32,7 @@ class MenuItemCreatedResponse(BaseModel):
 class MenuItemListResponse(BaseModel):
     items: list[MenuItemResponse]
     pagination_metadata: PaginationMetadata
+    next_cursor: Optional[int] = None  # pass as after_id to fetch the next page
 
 
 class MenuItemAvailabilityUpdatedResponse(BaseModel):
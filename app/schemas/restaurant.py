@@ -1,34 +1,58 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from app.schemas.auth import CountryEnum
 
+# Validated as a plain string set check, without building an enum member per request
+CountryLiteral = Literal[tuple(country.value for country in CountryEnum)]
+
 
 class RestaurantCreate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     name: str
-    country: CountryEnum
+    country: CountryLiteral
 
 
 class RestaurantResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     id: int
     name: str
     country: str
 
-    class Config:
-        from_attributes = True
-
 
 class PaginationMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total: int
     skip: int
     limit: int
-    start: int  # 1-based index of first item on this page
-    end: int  # 1-based index of last item on this page
+    # Rows actually returned on this page; only used to derive start/end
+    num_items: int = Field(exclude=True)
+
+    @computed_field
+    @property
+    def start(self) -> int:
+        """1-based index of first item on this page (0 for an empty page)."""
+        return self.skip + 1 if self.num_items > 0 else 0
+
+    @computed_field
+    @property
+    def end(self) -> int:
+        """1-based index of last item on this page."""
+        return self.skip + self.num_items
 
 
 class RestaurantListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     items: list[RestaurantResponse]
     pagination_metadata: PaginationMetadata
 
 
 class RestaurantCreatedResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str
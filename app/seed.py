@@ -1,40 +1,71 @@
 import asyncio
-from sqlalchemy import select
+import logging
+from sqlalchemy import Table, column, select, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import AsyncSessionLocal
 from app.models import Role, Country
 from app.schemas.auth import CountryEnum, RoleEnum
 
 
-ROLES = [role.value for role in RoleEnum]
-COUNTRIES = [country.value for country in CountryEnum]
+# _value2member_map_ is the enum's own value -> member dict (a CPython Enum
+# implementation detail); its keys are exactly the member values.
+ROLES: frozenset[str] = frozenset(RoleEnum._value2member_map_)
+COUNTRIES: frozenset[str] = frozenset(CountryEnum._value2member_map_)
 
+# Above this many names, rows are sent with COPY instead of a multi-row INSERT
+COPY_THRESHOLD = 100
+
+logger = logging.getLogger(__name__)
 
-async def seed_roles_and_countries():
-    async with AsyncSessionLocal() as session:
 
-        # Seed Roles
-        for role_name in ROLES:
-            result = await session.execute(select(Role).where(Role.name == role_name))
-            existing_role = result.scalar_one_or_none()
+async def _bulk_seed(
+    session: AsyncSession, target: Table, names: frozenset[str]
+) -> list[str]:
+    """Insert the missing ``names`` into a lookup table and return the inserted ones.
 
-            if not existing_role:
-                session.add(Role(name=role_name))
-                print(f"Inserted role: {role_name}")
+    Names that already exist are skipped by the unique constraint on ``name``.
+    """
+    if len(names) <= COPY_THRESHOLD:
+        stmt = pg_insert(target).values([{"name": name} for name in names])
+    else:
+        # COPY has no ON CONFLICT, so copy into a temp table and insert from there
+        staging = table(f"{target.name}_seed", column("name"))
+        await session.execute(
+            text(f"CREATE TEMP TABLE {staging.name} (name text) ON COMMIT DROP")
+        )
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            staging.name, records=[(name,) for name in names], columns=["name"]
+        )
+        stmt = pg_insert(target).from_select(["name"], select(staging.c.name))
 
-        # Seed Countries
-        for country_name in COUNTRIES:
-            result = await session.execute(
-                select(Country).where(Country.name == country_name)
-            )
-            existing_country = result.scalar_one_or_none()
+    result = await session.execute(
+        stmt.on_conflict_do_nothing(index_elements=["name"]).returning(target.c.name)
+    )
+    return result.scalars().all()
 
-            if not existing_country:
-                session.add(Country(name=country_name))
-                print(f"Inserted country: {country_name}")
 
-        await session.commit()
-        print("Seeding completed successfully.")
+async def seed_roles_and_countries():
+    # One transaction for all seed statements; committed when the block exits.
+    # Core tables rather than the mapped classes, so the inserts skip the ORM.
+    async with AsyncSessionLocal() as session, session.begin():
+        inserted_roles = await _bulk_seed(session, Role.__table__, ROLES)
+        inserted_countries = await _bulk_seed(session, Country.__table__, COUNTRIES)
+
+    logger.info(
+        "Seeding completed: inserted %d roles, %d countries",
+        len(inserted_roles),
+        len(inserted_countries),
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_roles_and_countries())
+    logging.basicConfig(level=logging.INFO)
+    try:
+        import uvloop
+    except ImportError:  # not available on Windows
+        asyncio.run(seed_roles_and_countries())
+    else:
+        uvloop.run(seed_roles_and_countries())